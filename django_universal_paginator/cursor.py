@@ -137,8 +137,12 @@ class CursorPaginator(Paginator):
 	def get_start_order_key(self, number):
 		return number
 
+	@cached_property
+	def prepared_order_key(self):
+		return utils.prepare_order_key(self.order_by)
+
 	def get_order_key(self, obj):
-		return utils.get_order_key(obj, self.order_by)
+		return utils.extract_order_key(obj, self.prepared_order_key)
 
 
 def paginate_cursor_queryset(queryset, page_number, page_size):
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
+from functools import lru_cache
+
 from django import template
+from django.conf import settings
 from django.core.paginator import Paginator
-from django.template.loader import render_to_string
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template.loader import select_template
 from django.urls import reverse, NoReverseMatch
 from django.utils.encoding import force_str
+from django.utils.functional import cached_property
 from django.utils.safestring import mark_safe
 
 from ..settings import PAGINATOR_ON_EACH_SIDE, PAGINATOR_ON_ENDS, PAGINATOR_TEMPLATE_NAME
@@ -12,21 +18,102 @@ from ..settings import PAGINATOR_ON_EACH_SIDE, PAGINATOR_ON_ENDS, PAGINATOR_TEMP
 register = template.Library()
 
 
+@lru_cache(maxsize=64)
+def load_template(template_names):
+	return select_template(template_names)
+
+
+@receiver(setting_changed)
+def reset_template_cache(*, setting, **kwargs): # pylint: disable=unused-argument
+	if setting == 'TEMPLATES':
+		load_template.cache_clear()
+
+
+def get_template(template_name):
+	"""
+	Returns template, loaded templates are cached unless DEBUG is enabled
+	"""
+	template_names = (template_name,) if isinstance(template_name, str) else tuple(template_name)
+	if settings.DEBUG:
+		return select_template(template_names)
+	return load_template(template_names)
+
+
 def assign_range_to_page_obj(page_obj, on_each_side, on_ends):
 	page_range = page_obj.paginator.get_elided_page_range(page_obj.number, on_each_side=on_each_side, on_ends=on_ends)
 	page_obj.page_range = [None if page == Paginator.ELLIPSIS else page for page in page_range]
 	return page_obj
 
 
+class PagerUrlBuilder:
+	"""
+	Builds page URLs, values shared by all pages are computed only once
+	"""
+	def __init__(self, request, url_name, url_args, url_kwargs, page_kwarg): # pylint: disable=too-many-arguments
+		self.request = request
+		self.url_name = url_name
+		self.url_args = url_args
+		self.url_kwargs = url_kwargs
+		self.page_kwarg = page_kwarg
+
+	@classmethod
+	def from_context(cls, context):
+		return cls(context['request'], context['url_name'], context['url_args'], context['url_kwargs'], context['page_kwarg'])
+
+	@cached_property
+	def kwargs(self):
+		return {k: v for k, v in self.url_kwargs.items() if v is not None}
+
+	@cached_property
+	def first_page_kwargs(self):
+		kwargs = self.url_kwargs.copy()
+		kwargs.pop(self.page_kwarg, None)
+		return kwargs
+
+	@cached_property
+	def get_params(self):
+		return '?' + self.request.GET.urlencode() if self.request.GET else ''
+
+	@cached_property
+	def base_url(self):
+		return reverse(self.url_name, args=self.url_args, kwargs=self.url_kwargs)
+
+	@cached_property
+	def query(self):
+		return self.request.GET.copy()
+
+	def get_kwargs_url(self, page_num):
+		kwargs = self.kwargs.copy()
+		kwargs[self.page_kwarg] = page_num
+		full_url = reverse(self.url_name, args=self.url_args, kwargs=kwargs) + self.get_params
+		if page_num == 1:
+			try:
+				return reverse(self.url_name, args=self.url_args, kwargs=self.first_page_kwargs) + self.get_params
+			except NoReverseMatch:
+				pass
+		return full_url
+
+	def get_url(self, page_num):
+		# page number is passed in URL kwargs unless URL can't be reversed
+		try:
+			return self.get_kwargs_url(page_num)
+		except NoReverseMatch:
+			pass
+		query = self.query
+		query[self.page_kwarg] = force_str(page_num)
+		return self.base_url + '?' + query.urlencode()
+
+
 def pagination_ctx(context, page_obj, page_kwarg, on_each_side, on_ends, extra_context, url_name, url_args, url_kwargs): # pylint: disable=too-many-arguments
-	if page_obj is None or page_obj == '':
-		page_obj = context['page_obj']
+	# lookups in flattened dictionary are cheaper than lookups in context stack
 	if hasattr(context, 'flatten'):
 		inner_context = context.flatten()
 	else:
 		inner_context = dict(context)
+	if page_obj is None or page_obj == '':
+		page_obj = inner_context['page_obj']
+	request = inner_context.get('request')
 	if url_name is None:
-		request = context['request']
 		resolver_match = request.resolver_match
 		url_name = resolver_match.view_name
 		url_args = resolver_match.args
@@ -42,6 +129,7 @@ def pagination_ctx(context, page_obj, page_kwarg, on_each_side, on_ends, extra_c
 		'url_name': url_name,
 		'url_args': url_args,
 		'url_kwargs': url_kwargs,
+		'pager_url_builder': PagerUrlBuilder(request, url_name, url_args, url_kwargs, page_kwarg),
 	}
 	inner_context.update(ctx_update)
 	if extra_context is not None:
@@ -51,35 +139,16 @@ def pagination_ctx(context, page_obj, page_kwarg, on_each_side, on_ends, extra_c
 
 @register.simple_tag(takes_context=True)
 def pagination(context, page_obj=None, page_kwarg='page', template_name=PAGINATOR_TEMPLATE_NAME, on_each_side=PAGINATOR_ON_EACH_SIDE, on_ends=PAGINATOR_ON_ENDS, extra_context=None, url_name=None, *url_args, **url_kwargs): # pylint: disable=too-many-arguments
-	rendered = render_to_string(template_name, pagination_ctx(context, page_obj, page_kwarg, on_each_side, on_ends, extra_context, url_name, url_args, url_kwargs))
+	rendered = get_template(template_name).render(pagination_ctx(context, page_obj, page_kwarg, on_each_side, on_ends, extra_context, url_name, url_args, url_kwargs))
 	return mark_safe(rendered)
 
 
 @register.simple_tag(takes_context=True)
 def pager_url(context, page_num):
-	request = context['request']
-	url_name = context['url_name']
-	url_args = context['url_args']
-	url_kwargs = context['url_kwargs']
-	page_kwarg = context['page_kwarg']
-	kwargs = {k: v for k, v in url_kwargs.items() if v is not None}
-	kwargs[page_kwarg] = page_num
-	try:
-		get_params = '?' + request.GET.urlencode() if request.GET else ''
-		full_url = reverse(url_name, args=url_args, kwargs=kwargs) + get_params
-		if page_num == 1:
-			kwargs = url_kwargs.copy()
-			kwargs.pop(page_kwarg, None)
-			try:
-				return reverse(url_name, args=url_args, kwargs=kwargs) + get_params
-			except NoReverseMatch:
-				pass
-		return full_url
-	except NoReverseMatch:
-		get = request.GET.copy()
-		get[page_kwarg] = force_str(page_num)
-		base_url = reverse(url_name, args=url_args, kwargs=url_kwargs)
-		return base_url + '?' + get.urlencode()
+	builder = context.get('pager_url_builder')
+	if builder is None:
+		builder = PagerUrlBuilder.from_context(context)
+	return builder.get_url(page_num)
 
 
 try:
@@ -1,81 +1,110 @@
 # -*- coding: utf-8 -*-
+import binascii
 import logging
 import struct
-from copy import deepcopy
-from datetime import time, date, datetime, timezone
+from base64 import urlsafe_b64encode, urlsafe_b64decode
+from collections import namedtuple
+from datetime import time, date, datetime, timedelta, timezone
 from decimal import Decimal as D
+from functools import lru_cache, partial
+from operator import attrgetter
 from typing import Union
 
 from django.core.paginator import InvalidPage, Paginator
-from django.db.models import Q, F
+from django.db.models import F, OrderBy, Q
 from django.db.models.constants import LOOKUP_SEP
-from django.db.models.expressions import OrderBy
 from django.http import Http404
-from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.translation import gettext_lazy as _
 
 from . import constants
 
 
+try:
+	from pybase64 import urlsafe_b64encode as fast_urlsafe_b64encode, urlsafe_b64decode as fast_urlsafe_b64decode
+except ImportError: # pragma: no cover
+	fast_urlsafe_b64encode, fast_urlsafe_b64decode = urlsafe_b64encode, urlsafe_b64decode # pragma: no cover
+
+
+FAST_BASE64_ENCODE_MIN_SIZE = 192
+"""
+Minimal data size in bytes for vectorized base64 encoding, smaller values
+are encoded faster with standard library
+"""
+
+FAST_BASE64_DECODE_MIN_SIZE = 100
+"""
+Minimal encoded string length for vectorized base64 decoding, shorter
+strings are decoded faster with standard library
+"""
+
 logger = logging.getLogger(__name__)
 
 
+PreparedOrderKey = namedtuple('PreparedOrderKey', ['attributes', 'getters'])
+
+
 class SerializationError(RuntimeError):
 	pass
 
 
+U8 = struct.Struct('B')
+U16 = struct.Struct('!H')
+U32 = struct.Struct('!I')
+U64 = struct.Struct('!Q')
+F64 = struct.Struct('!d')
+
+
 def is_short_string(v) -> bool:
 	return isinstance(v, str) and len(v.encode('utf-8')) < 320
 
 
-def serialize_short_string(v: str) -> bytes:
+def serialize_short_string(buf: bytearray, v: str):
 	v = v.encode('utf-8')
-	return struct.pack('B', len(v) - 64) + v
+	buf.append(len(v) - 64)
+	buf += v
 
 
-def deserialize_short_string(v: bytes) -> tuple:
-	length = v[0] + 64
-	text = v[1:length + 1].decode('utf-8')
-	return length + 1, text
+def deserialize_short_string(buf: bytes, offset: int) -> tuple:
+	length = buf[offset] + 64
+	offset += 1
+	return offset + length, buf[offset:offset + length].decode('utf-8')
 
 
 def is_long_string(v) -> bool:
-	if not isinstance(v, str):
-		return False
-	v = v.encode('utf-8')
-	if len(v) > (65535+320):
-		raise SerializationError("String value too long")
-	return True
+	return isinstance(v, str)
 
 
-def serialize_long_string(v: str) -> bytes:
+def serialize_long_string(buf: bytearray, v: str):
 	v = v.encode('utf-8')
-	length = len(v) - 320
-	return struct.pack('!H', length) + v
+	buf += U16.pack(len(v) - 320)
+	buf += v
 
 
-def deserialize_long_string(v: bytes) -> tuple:
-	length = struct.unpack('!H', v[:2])[0] + 320
-	return length + 2, v[2:length + 2].decode('utf-8')
+def deserialize_long_string(buf: bytes, offset: int) -> tuple:
+	length = U16.unpack_from(buf, offset)[0] + 320
+	offset += 2
+	return offset + length, buf[offset:offset + length].decode('utf-8')
 
 
 def is_bytes(v) -> bool:
 	return isinstance(v, bytes)
 
 
-def serialize_bytes(v: bytes) -> bytes:
+def serialize_bytes(buf: bytearray, v: bytes):
 	if len(v) > 65535:
 		raise SerializationError("Bytes value too long")
-	return struct.pack('!H', len(v)) + v
+	buf += U16.pack(len(v))
+	buf += v
 
 
-def deserialize_bytes(v: bytes) -> tuple:
-	length = struct.unpack('!H', v[:2])[0]
-	return length + 2, v[2:]
+def deserialize_bytes(buf: bytes, offset: int) -> tuple:
+	length = U16.unpack_from(buf, offset)[0]
+	offset += 2
+	return offset + length, buf[offset:offset + length]
 
 
 NUMBER_SIZES = [1, 2, 4, 8]
-NUMBER_FORMATS = ['B', '!H', '!I', '!Q']
+NUMBER_STRUCTS = [U8, U16, U32, U64]
 NUMBER_MAX_VALUES = [sum(256**s for s in NUMBER_SIZES[0:size+1]) for size in range(4)]
 NUMBER_SUBTRACTS = [0] + NUMBER_MAX_VALUES[:-1]
 
@@ -84,6 +113,8 @@ def number_serializer(size_idx, number_type):
 	negative = size_idx < 0
 	size_idx = abs(size_idx) - 1
 	size = NUMBER_SIZES[size_idx]
+	pack = NUMBER_STRUCTS[size_idx].pack
+	unpack_from = NUMBER_STRUCTS[size_idx].unpack_from
 
 	max_val = NUMBER_MAX_VALUES[size_idx]
 	subtract = NUMBER_SUBTRACTS[size_idx]
@@ -100,77 +131,74 @@ def number_serializer(size_idx, number_type):
 			val = -val
 		return val >= 0 and val < max_val
 
-	def serialize(val):
-		val = val
+	def serialize(buf, val):
 		if negative:
 			val = -val - 1
 		val = val - subtract
 		if isinstance(val, D):
 			val = int(val.to_integral_value())
-		return struct.pack(NUMBER_FORMATS[size_idx], val)
+		buf += pack(val)
 
-	def deserialize(val):
-		val = struct.unpack(NUMBER_FORMATS[size_idx], val[:size])[0] + subtract
+	def deserialize(buf, offset):
+		val = unpack_from(buf, offset)[0] + subtract
 		if negative:
 			val = -val - 1
-		return size, number_type(val)
+		return offset + size, number_type(val)
 
 	return (match, serialize, deserialize)
 
 
-def serialize_long_number(val: Union[int, D]) -> bytes:
+def serialize_long_number(buf: bytearray, val: Union[int, D]):
 	val = str(val).encode('utf-8')
 	if len(val) < 255:
-		return struct.pack('B', len(val)) + val
+		buf.append(len(val))
 	else:
-		return struct.pack('B', 255) + struct.pack('!H', len(val) - 255) + val
+		buf.append(255)
+		buf += U16.pack(len(val) - 255)
+	buf += val
 
 
-def deserialize_long_number_type(val: bytes, number_type: type) -> tuple:
-	header_size = 1
-	length = val[0]
+def deserialize_long_number_type(buf: bytes, offset: int, number_type: type) -> tuple:
+	length = buf[offset]
+	offset += 1
 	if length == 255:
-		length = struct.unpack('!H', val[1:3])[0] + 255
-		header_size = 3
-	num = number_type(val[header_size:header_size+length].decode('utf-8'))
-	return (length + header_size, num)
+		length = U16.unpack_from(buf, offset)[0] + 255
+		offset += 2
+	num = number_type(buf[offset:offset + length].decode('utf-8'))
+	return (offset + length, num)
 
 
-def deserialize_long_number(val: bytes) -> tuple:
-	return deserialize_long_number_type(val, int)
+def deserialize_long_number(buf: bytes, offset: int) -> tuple:
+	return deserialize_long_number_type(buf, offset, int)
 
 
-def deserialize_long_decimal(val: bytes) -> D:
-	return deserialize_long_number_type(val, D)
+def deserialize_long_decimal(buf: bytes, offset: int) -> tuple:
+	return deserialize_long_number_type(buf, offset, D)
 
 
-def serialize_time(val: time) -> bytes:
+def serialize_time(buf: bytearray, val: time):
 	num = val.second + val.minute * 60 + val.hour * 3600
 	if val.microsecond == 0:
-		num = struct.pack('!I', num)
-		return num[-3:] # only 3 bytes needed
+		buf += num.to_bytes(3, 'big') # only 3 bytes needed
 	else:
 		num = num * 1000000 + val.microsecond + (2 ** 39)
-		num = struct.pack('!Q', num)
-		return num[-5:] # only 3 bytes needed
+		buf += num.to_bytes(5, 'big') # only 5 bytes needed
 
 
-def deserialize_time(val: bytes) -> tuple:
-	first = val[0]
+def deserialize_time(buf: bytes, offset: int) -> tuple:
+	first = buf[offset]
 	microseconds = 0
 	if first < 128: # without microseconds
 		length = 3
-		val = b'\x00' + val[:3]
-		num = struct.unpack('!I', val)[0]
+		num = int.from_bytes(buf[offset:offset + length], 'big')
 	else:
 		length = 5
-		val = b'\x00\x00\x00' + val[:5]
-		num = struct.unpack('!Q', val)[0]
+		num = int.from_bytes(buf[offset:offset + length], 'big')
 		num &= 0x7fffffffff
 		microseconds = num % 1000000
 		num = num // 1000000
 	val = time(num // 3600, (num // 60) % 60, num % 60, microseconds)
-	return (length, val)
+	return (offset + length, val)
 
 
 def date_serializer(use_timezone: bool, use_microsecond: bool) -> tuple:
@@ -181,38 +209,34 @@ def date_serializer(use_timezone: bool, use_microsecond: bool) -> tuple:
 		has_microsecond = value.microsecond != 0
 		return has_timezone == use_timezone and has_microsecond == use_microsecond
 
-	def serialize(val: datetime) -> bytes:
+	def serialize(buf: bytearray, val: datetime):
 		if val.tzinfo:
 			val = val.astimezone(timezone.utc)
 
-		timestamp = (val.date().toordinal() - 719163) * 86400
-		timestamp += val.time().hour * 3600 + val.time().minute * 60 + val.time().second
+		timestamp = (val.toordinal() - 719163) * 86400
+		timestamp += val.hour * 3600 + val.minute * 60 + val.second
 
 		julian_timestamp = timestamp + 210866760000
-		data = struct.pack('!Q', julian_timestamp)
+		buf += U64.pack(julian_timestamp)
 		if use_microsecond:
-			data += struct.pack('!I', val.microsecond)
+			buf += U32.pack(val.microsecond)
 
-		return data
+	epoch = datetime(1970, 1, 1, tzinfo=timezone.utc if use_timezone else None)
 
-	def deserialize(val: bytes) -> tuple:
-		timestamp = struct.unpack('!Q', val[0:8])[0] - 210866760000
-		value = datetime.utcfromtimestamp(timestamp)
-		if use_timezone:
-			value = value.replace(tzinfo=timezone.utc)
+	def deserialize(buf: bytes, offset: int) -> tuple:
+		timestamp = U64.unpack_from(buf, offset)[0] - 210866760000
 		if use_microsecond:
-			value = value.replace(microsecond=struct.unpack('!I', val[8:12])[0])
-
-		return (12 if use_microsecond else 8, value)
+			return (offset + 12, epoch + timedelta(seconds=timestamp, microseconds=U32.unpack_from(buf, offset + 8)[0]))
+		return (offset + 8, epoch + timedelta(seconds=timestamp))
 
 	return (match, serialize, deserialize)
 
 
 
 VALUE_SERIALIZERS = [
-	(lambda v: v is None, lambda v: b'', lambda v: (0, None)),
-	(lambda v: v is True, lambda v: b'', lambda v: (0, True)),
-	(lambda v: v is False, lambda v: b'', lambda v: (0, False)),
+	(lambda v: v is None, lambda buf, v: None, lambda buf, offset: (offset, None)),
+	(lambda v: v is True, lambda buf, v: None, lambda buf, offset: (offset, True)),
+	(lambda v: v is False, lambda buf, v: None, lambda buf, offset: (offset, False)),
 	(is_short_string, serialize_short_string, deserialize_short_string),
 	(is_long_string, serialize_long_string, deserialize_long_string),
 	(is_bytes, serialize_bytes, deserialize_bytes),
@@ -234,20 +258,155 @@ VALUE_SERIALIZERS = [
 	number_serializer(4, D), # eight bytes positive
 	number_serializer(-4, D), # eight bytes negative
 	(lambda v: isinstance(v, D) and v.to_integral_value() == v, serialize_long_number, deserialize_long_decimal),
-	(lambda v: isinstance(v, float), lambda v: struct.pack('!d', v), lambda v: (8, struct.unpack('!d', v[:8])[0])),
+	(lambda v: isinstance(v, float), lambda buf, v: buf.extend(F64.pack(v)), lambda buf, offset: (offset + 8, F64.unpack_from(buf, offset)[0])),
 	(lambda v: isinstance(v, D), serialize_long_number, deserialize_long_decimal),
 	date_serializer(use_timezone=False, use_microsecond=False),
 	date_serializer(use_timezone=False, use_microsecond=True),
 	date_serializer(use_timezone=True, use_microsecond=False),
 	date_serializer(use_timezone=True, use_microsecond=True),
 	(lambda v: isinstance(v, time), serialize_time, deserialize_time),
-	(lambda v: isinstance(v, date), lambda v: struct.pack('!I', v.toordinal() + 1721424), lambda v: (4, date.fromordinal(struct.unpack('!I', v[:4])[0] - 1721424))), # from julian date
+	(lambda v: isinstance(v, date), lambda buf, v: buf.extend(U32.pack(v.toordinal() + 1721424)), lambda buf, offset: (offset + 4, date.fromordinal(U32.unpack_from(buf, offset)[0] - 1721424))), # from julian date
 ]
 """
 List of (check function, serialize function, deserialize function)
+
+Serialize function takes bytearray and value and appends serialized value
+to the bytearray.
+
+Deserialize function takes buffer and offset and returns tuple of (new
+offset, value).
+"""
+
+# positions in VALUE_SERIALIZERS used as type tags
+NONE_TAG = 0
+TRUE_TAG = 1
+FALSE_TAG = 2
+SHORT_STRING_TAG = 3
+LONG_STRING_TAG = 4
+BYTES_TAG = 5
+INT_TAG = 6 # first of 8 fixed size integer tags
+LONG_INT_TAG = 14
+DECIMAL_TAG = 15 # first of 8 fixed size decimal tags
+LONG_DECIMAL_TAG = 23
+FLOAT_TAG = 24
+FRACTIONAL_DECIMAL_TAG = 25
+DATETIME_TAG = 26 # first of 4 datetime tags
+TIME_TAG = 30
+DATE_TAG = 31
+TINY_STRING_TAG = 192 # tags from 192 to 255 are used for strings shorter than 64 bytes
+
+
+SERIALIZE_FUNCTIONS = tuple(serialize for __, serialize, __ in VALUE_SERIALIZERS)
+DESERIALIZE_FUNCTIONS = tuple(deserialize for __, __, deserialize in VALUE_SERIALIZERS)
+
+NUMBER_BIT_LENGTH_SIZES = [
+	next(size_idx for size_idx, max_val in enumerate(NUMBER_MAX_VALUES) if max_val > (1 << bit_length >> 1))
+	for bit_length in range((NUMBER_MAX_VALUES[-1] - 1).bit_length() + 1)
+]
+"""
+Smallest size index for number with given bit length, larger numbers with
+same bit length can require next size
 """
 
 
+def write_tagged(tag: int, buf: bytearray, value):
+	buf.append(tag)
+	SERIALIZE_FUNCTIONS[tag](buf, value)
+
+
+def write_string(buf: bytearray, value: str):
+	data = value.encode('utf-8')
+	length = len(data)
+	if length < 64:
+		buf.append(TINY_STRING_TAG + length)
+		buf += data
+	elif length < 320:
+		buf.append(SHORT_STRING_TAG)
+		buf.append(length - 64)
+		buf += data
+	elif length <= 65535 + 320:
+		buf.append(LONG_STRING_TAG)
+		buf += U16.pack(length - 320)
+		buf += data
+	else:
+		raise SerializationError("String value too long")
+
+
+def write_number(buf: bytearray, value: Union[int, D], num: int, first_tag: int, long_tag: int): # pylint: disable=too-many-arguments
+	negative = 0
+	if num < 0:
+		num = -num - 1
+		negative = 1
+	bit_length = num.bit_length()
+	if bit_length < len(NUMBER_BIT_LENGTH_SIZES):
+		size_idx = NUMBER_BIT_LENGTH_SIZES[bit_length]
+		if num >= NUMBER_MAX_VALUES[size_idx]:
+			size_idx += 1
+		if size_idx < len(NUMBER_SIZES):
+			buf.append(first_tag + size_idx * 2 + negative)
+			buf += NUMBER_STRUCTS[size_idx].pack(num - NUMBER_SUBTRACTS[size_idx])
+			return
+	buf.append(long_tag)
+	serialize_long_number(buf, value)
+
+
+def write_int(buf: bytearray, value: int):
+	write_number(buf, value, value, INT_TAG, LONG_INT_TAG)
+
+
+def write_decimal(buf: bytearray, value: D):
+	if value.to_integral_value() != value:
+		write_tagged(FRACTIONAL_DECIMAL_TAG, buf, value)
+	elif value.is_infinite():
+		write_tagged(LONG_DECIMAL_TAG, buf, value)
+	else:
+		write_number(buf, value, int(value), DECIMAL_TAG, LONG_DECIMAL_TAG)
+
+
+def write_datetime(buf: bytearray, value: datetime):
+	write_tagged(DATETIME_TAG + (2 if value.tzinfo is not None else 0) + (1 if value.microsecond != 0 else 0), buf, value)
+
+
+VALUE_WRITERS = {
+	type(None): partial(write_tagged, NONE_TAG),
+	bool: lambda buf, v: buf.append(TRUE_TAG if v else FALSE_TAG),
+	str: write_string,
+	bytes: partial(write_tagged, BYTES_TAG),
+	int: write_int,
+	D: write_decimal,
+	float: partial(write_tagged, FLOAT_TAG),
+	datetime: write_datetime,
+	time: partial(write_tagged, TIME_TAG),
+	date: partial(write_tagged, DATE_TAG),
+}
+"""
+Map of exact value type to function writing type tag and serialized value,
+subclasses are resolved using check functions
+"""
+
+
+def check_value_writers():
+	"""
+	Verify, that VALUE_WRITERS produce same output as first matching entry of
+	VALUE_SERIALIZERS
+	"""
+	numbers = [num for max_val in NUMBER_MAX_VALUES for num in (max_val - 1, -max_val)]
+	numbers += [NUMBER_MAX_VALUES[-1], -NUMBER_MAX_VALUES[-1] - 1]
+	samples = [None, True, False, 'x' * 64, 'x' * 320, b'', 1.5, D('1.5'), D('Infinity'), D('NaN'), time(1), time(1, 0, 0, 1), date(2000, 1, 1)]
+	samples += numbers + [D(num) for num in numbers]
+	samples += [datetime(2000, 1, 1, 0, 0, 0, microsecond, tzinfo) for tzinfo in (None, timezone.utc) for microsecond in (0, 1)]
+	for value in samples:
+		written = bytearray()
+		VALUE_WRITERS[type(value)](written, value)
+		tag = next(i for i, (check, __, __) in enumerate(VALUE_SERIALIZERS) if check(value))
+		expected = bytearray([tag])
+		SERIALIZE_FUNCTIONS[tag](expected, value)
+		assert written == expected, f"Wrong serialization of {value!r}"
+
+
+check_value_writers()
+
+
 def paginate_queryset(queryset, page, page_size):
 	"""
 	Shortcut to paginate queryset
@@ -265,15 +424,39 @@ def paginate_queryset(queryset, page, page_size):
 		raise Http404(_('Invalid page (%(page_number)s): %(message)s') % {'page_number': page_number, 'message': str(e)})
 
 
+@lru_cache(maxsize=256)
+def get_attribute_getter(attribute):
+	"""
+	Returns getter for django path like review__book
+	"""
+	return attrgetter(attribute.replace(LOOKUP_SEP, '.'))
+
+
 def get_model_attribute(obj, attribute):
 	"""
 	Get model attribute by traversing attributes by django path like review__book
 	"""
 	if isinstance(obj, dict):
 		return obj[attribute]
-	for lookup in attribute.split(LOOKUP_SEP):
-		obj = getattr(obj, lookup)
-	return obj
+	return get_attribute_getter(attribute)(obj)
+
+
+def prepare_order_key(order_by) -> PreparedOrderKey:
+	"""
+	Prepare attribute getters for order key, result can be reused for all
+	objects ordered by order_by
+	"""
+	attributes = tuple(f.expression.name if isinstance(f, OrderBy) else f.lstrip('-') for f in order_by)
+	return PreparedOrderKey(attributes, tuple(get_attribute_getter(attribute) for attribute in attributes))
+
+
+def extract_order_key(obj, prepared_order_key: PreparedOrderKey) -> tuple:
+	"""
+	Get order key of object using result of prepare_order_key
+	"""
+	if isinstance(obj, dict):
+		return tuple(obj[attribute] for attribute in prepared_order_key.attributes)
+	return tuple(getter(obj) for getter in prepared_order_key.getters)
 
 
 def get_order_key(obj, order_by):
@@ -281,56 +464,109 @@ def get_order_key(obj, order_by):
 	Get list of attributes for order key, e.g. if order_key is ['pk'], it will
 	return [obj.pk]
 	"""
-	return tuple(
-		get_model_attribute(obj, f.expression.name if isinstance(f, OrderBy) else f.lstrip('-'))
-		for f in order_by
-	)
+	return extract_order_key(obj, prepare_order_key(order_by))
 
 
-def serialize_value(value) -> bytes:
-	if isinstance(value, str) and len(value.encode('utf-8')) < 64:
-		value = value.encode('utf-8')
-		return struct.pack('B', 192 + len(value)) + value
+def write_value(buf: bytearray, value):
+	writer = VALUE_WRITERS.get(type(value))
+	if writer is not None:
+		writer(buf, value)
+		return
+
+	if isinstance(value, str):
+		write_string(buf, value)
+		return
 
 	for i, serializer in enumerate(VALUE_SERIALIZERS):
 		checker, serializer, __ = serializer
 		if checker(value):
-			return struct.pack('B', i) + serializer(value)
-	return serialize_value(str(value))
+			buf.append(i)
+			serializer(buf, value)
+			return
+	write_string(buf, str(value))
+
+
+def serialize_value(value) -> bytes:
+	buf = bytearray()
+	write_value(buf, value)
+	return bytes(buf)
 
 
 def serialize_values(values: list) -> bytes:
-	return b''.join(serialize_value(value) for value in values)
+	buf = bytearray()
+	for value in values:
+		write_value(buf, value)
+	return bytes(buf)
+
+
+def serialize_values_many(rows: list) -> list:
+	"""
+	Serialize list of rows, writer is selected once per column if all values
+	in column have the same type, rows with different lengths are serialized
+	one by one
+	"""
+	if len({len(row) for row in rows}) > 1:
+		return [serialize_values(row) for row in rows]
+	buffers = [bytearray() for __ in rows]
+	for column in zip(*rows):
+		value_type = type(column[0])
+		writer = VALUE_WRITERS.get(value_type)
+		if writer is None or not all(type(value) is value_type for value in column):
+			writer = write_value
+		for buf, value in zip(buffers, column):
+			writer(buf, value)
+	return [bytes(buf) for buf in buffers]
 
 
 def deserialize_values(data: bytes) -> list:
 	values = []
-	while data:
-		data_type, data = data[0], data[1:]
-		if data_type >= 192:
-			string_length = data_type - 192
-			values.append(data[:string_length].decode('utf-8'))
-			data = data[string_length:]
+	size = len(data)
+	offset = 0
+	while offset < size:
+		data_type = data[offset]
+		offset += 1
+		if data_type >= TINY_STRING_TAG:
+			string_length = data_type - TINY_STRING_TAG
+			values.append(data[offset:offset + string_length].decode('utf-8'))
+			offset += string_length
 		else:
-			consumed, value = VALUE_SERIALIZERS[data_type][2](data)
-			if consumed:
-				data = data[consumed:]
+			offset, value = DESERIALIZE_FUNCTIONS[data_type](data, offset)
 			values.append(value)
 	return values
 
 
+def urlsafe_base64_encode(s: bytes) -> str:
+	"""
+	Encode bytes to base64 string without padding
+	"""
+	encode = fast_urlsafe_b64encode if len(s) >= FAST_BASE64_ENCODE_MIN_SIZE else urlsafe_b64encode
+	return encode(s).rstrip(b'\n=').decode('ascii')
+
+
+def urlsafe_base64_decode(s: str) -> bytes:
+	"""
+	Decode base64 string encoded using urlsafe_base64_encode
+	"""
+	s = s.encode()
+	s = s.ljust(len(s) + len(s) % 4, b'=')
+	decode = fast_urlsafe_b64decode if len(s) >= FAST_BASE64_DECODE_MIN_SIZE else urlsafe_b64decode
+	try:
+		return decode(s)
+	except (LookupError, binascii.Error) as e:
+		raise ValueError(e)
+
+
 def url_decode_order_key(order_key):
 	"""
-	Encode list of order keys to URL string
+	Decode list of order keys from URL string
 	"""
 	return tuple(deserialize_values(urlsafe_base64_decode(order_key)))
 
 
 def url_encode_order_key(value):
 	"""
-	Decode list of order keys from URL string
+	Encode list of order keys to URL string using compact binary serialization
 	"""
-	# prevent microsecond clipping
 	return urlsafe_base64_encode(serialize_values(value))
 
 
@@ -346,7 +582,7 @@ def invert_order_by(order_by):
 	"""
 	Invert list of OrderBy expressions
 	"""
-	order_by = deepcopy(order_by)
+	order_by = [field.copy() for field in order_by]
 	for field in order_by:
 		# invert asc / desc
 		field.descending = not field.descending
@@ -371,10 +607,21 @@ def convert_to_order_by(field):
 	return F(field[1:]).desc() if field[:1] == '-' else F(field).asc()
 
 
+@lru_cache(maxsize=128)
+def convert_field_names_to_expressions(field_names: tuple) -> tuple:
+	"""
+	Cached conversion of field names like ('pk',) to OrderBy objects
+	"""
+	return tuple(convert_to_order_by(field) for field in field_names)
+
+
 def convert_order_by_to_expressions(order_by):
 	"""
-	Converts list of order_by keys like ['pk'] to list of OrderBy objects
+	Converts list of order_by keys like ['pk'] to list of OrderBy objects,
+	expressions created from field names are cached and must not be modified
 	"""
+	if all(isinstance(field, str) for field in order_by):
+		return list(convert_field_names_to_expressions(tuple(order_by)))
 	return [convert_to_order_by(field) for field in order_by]
 
 
@@ -395,7 +642,7 @@ def filter_by_order_key(qs, direction, start_position):
 		order_by = invert_order_by(order_by)
 		qs = qs.order_by(*order_by)
 
-	filter_combinations = {}
+	equality_prefix = Q() # all previous fields equal to start position
 	q = Q() # final filter
 
 	# create chain of rule rule for example for name="x" parent=1, id=2 will be following:
@@ -404,8 +651,6 @@ def filter_by_order_key(qs, direction, start_position):
 		# filter by
 		field_name = order_expression.expression.name
 
-		field_lookup = ''
-
 		# Value  Order (NULL)  First condition    Next condition
 		# ------------------------------------------------------
 		# Val    Last          >< Val | NULL      =Val
@@ -415,16 +660,14 @@ def filter_by_order_key(qs, direction, start_position):
 
 		if value is None: # special NULL handling
 			if order_expression.nulls_last:
-				field_lookup = f'{field_name}__isnull'
-				filter_combinations[field_lookup] = True
+				equality_prefix &= Q(**{f'{field_name}__isnull': True})
 				continue
 			if order_expression.nulls_first:
-				filter_combinations[f'{field_name}__isnull'] = False
-				q |= Q(**filter_combinations)
-				filter_combinations[f'{field_name}__isnull'] = True
+				q |= equality_prefix & Q(**{f'{field_name}__isnull': False})
+				equality_prefix &= Q(**{f'{field_name}__isnull': True})
 				continue
-			else:
-				logger.warning("No nulls_first / nulls_last specified")
+			logger.warning("No nulls_first / nulls_last specified")
+			q |= equality_prefix
 		else:
 			# smaller or greater
 			direction = 'lt' if order_expression.descending else 'gt'
@@ -432,25 +675,14 @@ def filter_by_order_key(qs, direction, start_position):
 			# construct field lookup
 			field_lookup = f'{field_name}__{direction}'
 
-			# set lookup to current combination
+			# apply combination
 			if order_expression.nulls_last:
-				filter_combination = (
-					Q(**filter_combinations) &
-					(Q(**{field_lookup: value}) | Q(**{f'{field_name}__isnull': True}))
-				)
-				q |= filter_combination
-				filter_combinations[field_name] = value
-				continue
+				q |= equality_prefix & (Q(**{field_lookup: value}) | Q(**{f'{field_name}__isnull': True}))
 			else:
-				filter_combinations[field_lookup] = value
-
-		# apply combination
-		filter_combination = Q(**filter_combinations)
-		q |= filter_combination
+				q |= equality_prefix & Q(**{field_lookup: value})
 
 		# transform >, < to equals
-		filter_combinations.pop(field_lookup, None)
-		filter_combinations[field_name] = value
+		equality_prefix &= Q(**{field_name: value})
 
 	# apply filter
 	if q:
@@ -4,10 +4,11 @@ import unittest
 from datetime import datetime, time, date
 from decimal import Decimal as D
 
+from django.conf import settings
 from django.core.paginator import InvalidPage
 from django.db.models import F
 from django.http import Http404
-from django.test import TestCase
+from django.test import RequestFactory, TestCase
 from django.urls import reverse
 from django.utils import timezone
 
@@ -15,7 +16,8 @@ from .models import Book, BookOrdered, Review
 from django_universal_paginator import constants
 from django_universal_paginator.converter import PageConverter, CursorPageConverter
 from django_universal_paginator.cursor import paginate_cursor_queryset, CursorPaginateMixin, CursorPaginator
-from django_universal_paginator.utils import paginate_queryset, get_model_attribute, get_order_key, url_encode_order_key, url_decode_order_key, get_order_by, invert_order_by, convert_to_order_by, convert_order_by_to_expressions, filter_by_order_key, serialize_value, serialize_values, deserialize_values, SerializationError
+from django_universal_paginator.templatetags.paginator_tags import get_template, pager_url
+from django_universal_paginator.utils import paginate_queryset, get_model_attribute, get_order_key, url_encode_order_key, url_decode_order_key, get_order_by, invert_order_by, convert_to_order_by, convert_order_by_to_expressions, filter_by_order_key, serialize_value, serialize_values, serialize_values_many, deserialize_values, SerializationError
 
 
 class CursorPaginatedView(CursorPaginateMixin):
@@ -86,6 +88,7 @@ class TestUtils(TestCase):
 
 		self.assertEqual("review", get_model_attribute(review, "text"))
 		self.assertEqual("book", get_model_attribute(review, "book__name"))
+		self.assertEqual("book", get_model_attribute({"book__name": "book"}, "book__name"))
 
 	def test_get_order_key(self):
 		book = Book.objects.create(name="book")
@@ -146,6 +149,18 @@ class TestUtils(TestCase):
 		processed_order_key = url_decode_order_key(url_encode_order_key(order_key))
 		self.assertEqual(order_key, processed_order_key)
 
+		# long value
+		order_key = ('x' * 100, 1)
+		self.assertEqual(order_key, url_decode_order_key(url_encode_order_key(order_key)))
+		order_key = ('x' * 200, 1)
+		self.assertEqual(order_key, url_decode_order_key(url_encode_order_key(order_key)))
+
+		# invalid base64
+		with self.assertRaises(ValueError):
+			url_decode_order_key('a')
+		with self.assertRaises(ValueError):
+			url_decode_order_key('a' * 101)
+
 	def test_invert_order_by(self):
 		order_by = [F('name').asc()]
 		inverted = [F('name').desc()]
@@ -163,6 +178,11 @@ class TestUtils(TestCase):
 		inverted = [F('name').desc(nulls_first=True)]
 		self.assertOrderByEqual(inverted[0], invert_order_by(order_by)[0])
 
+		# original expressions are not modified
+		order_by = [F('name').asc()]
+		invert_order_by(order_by)
+		self.assertFalse(order_by[0].descending)
+
 	def test_convert_order_by_to_expressions(self):
 		e = convert_to_order_by('pk')
 		self.assertEqual(e.expression.name, 'pk')
@@ -180,6 +200,9 @@ class TestUtils(TestCase):
 		self.assertEqual(e[0].expression.name, 'pk')
 		self.assertFalse(e[0].descending)
 
+		# field names are converted only once
+		self.assertIs(e[0], convert_order_by_to_expressions(('pk',))[0])
+
 	def assertOrderByEqual(self, a, b):
 		self.assertTrue(a.descending == b.descending and bool(a.nulls_first) == bool(b.nulls_first) and bool(a.nulls_last) == bool(b.nulls_last))
 
@@ -405,6 +428,25 @@ class TestTemplates(TestCase):
 		self.assertEqual(['example.jinja'], response.template_name)
 		self.assertContains(response, '/page/3/')
 
+	def test_template_cache(self):
+		self.assertIs(get_template('paginator/paginator.html'), get_template(['paginator/paginator.html']))
+		with self.settings(DEBUG=True):
+			self.assertIsNot(get_template('paginator/paginator.html'), get_template('paginator/paginator.html'))
+
+	def test_template_cache_reset(self):
+		template = get_template('paginator/paginator.html')
+		with self.settings(TEMPLATES=settings.TEMPLATES[1:]):
+			self.assertIsNot(template, get_template('paginator/paginator.html'))
+
+	def test_pager_url(self):
+		request = RequestFactory().get('/using-get/?q=1&page=2')
+		context = {'request': request, 'url_name': 'using_get', 'url_args': [], 'url_kwargs': {}, 'page_kwarg': 'page'}
+		self.assertEqual('/using-get/?q=1&page=3', pager_url(context, 3))
+
+		context.update({'url_name': 'page', 'url_kwargs': {'page': 2}})
+		self.assertEqual('/page/3/?q=1&page=2', pager_url(context, 3))
+		self.assertEqual('/page/?q=1&page=2', pager_url(context, 1))
+
 	def test_cursor_pagination(self):
 		url = reverse('cursor_page', kwargs={'page': 1})
 		response = self.client.get(url)
@@ -461,10 +503,24 @@ class TestSerializer(TestCase):
 		self.assertEqual(len(text) + 3, len(val))
 		self.assertEqual([text], deserialized)
 
+		# bytes followed by another value
+		data = [b'xy', 1]
+		self.assertEqual(data, deserialize_values(serialize_values(data)))
+
 		text = b'x' * 65536 # too long
 		with self.assertRaises(SerializationError):
 			serialize_values([text])
 
+	def test_serialize_many(self):
+		rows = [(1, 'a', None), (300, 'b', 1), (2, 'c', D('1.5'))]
+		self.assertEqual([serialize_values(row) for row in rows], serialize_values_many(rows))
+		self.assertEqual([], serialize_values_many([]))
+
+		# rows with different lengths
+		rows = [(1, 2), (3,)]
+		self.assertEqual([serialize_values(row) for row in rows], serialize_values_many(rows))
+		self.assertEqual([[1, 2], [3]], [deserialize_values(val) for val in serialize_values_many(rows)])
+
 	def test_serialize_unknown_object(self):
 		text = 'hello'
 		class UnknownObject(object):
@@ -476,6 +532,26 @@ class TestSerializer(TestCase):
 		deserialized = deserialize_values(val)
 		self.assertEqual([text], deserialized)
 
+	def test_serialize_subclass(self):
+		class Integer(int):
+			pass
+
+		class Decimal(D):
+			pass
+
+		class DateTime(datetime):
+			pass
+
+		class Text(str):
+			pass
+
+		# subclasses are serialized like base types
+		data = [Integer(1), Integer(-300), Decimal('1.5'), Decimal(2), DateTime(2020, 1, 1, 1, 2, 3), Text('x')]
+		val = serialize_values(data)
+		deserialized = deserialize_values(val)
+		self.assertEqual(data, deserialized)
+		self.assertEqual(serialize_values([1, -300, D('1.5'), D(2), datetime(2020, 1, 1, 1, 2, 3), 'x']), val)
+
 	def test_serialize_integer(self):
 		num_size_tests = [
 			(0, 1), # single byte, min value
@@ -520,6 +596,14 @@ class TestSerializer(TestCase):
 		self.assertEqual(data, deserialized)
 		self.assertEqual(10, len(val))
 
+	def test_serialize_decimal_special_values(self):
+		data = [D('Infinity'), D('-Infinity')]
+		deserialized = deserialize_values(serialize_values(data))
+		self.assertEqual(data, deserialized)
+
+		deserialized = deserialize_values(serialize_values([D('NaN')]))
+		self.assertTrue(deserialized[0].is_nan())
+
 	def test_serialize_time(self):
 		data = [time(1, 2, 3), time(23, 50, 40, 999999), time(23, 59, 59)]
 		val = serialize_values(data)